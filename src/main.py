@@ -7,19 +7,25 @@ disabling telemetry, AI features, and other privacy-invasive functionality.
 """
 
 import argparse
+import functools
 import json
 import logging
 import os
-import platform
-import re
-import shutil
-import subprocess
 import sys
-from datetime import datetime
+import time
 from pathlib import Path
-from typing import Optional
-import urllib.error
-import urllib.request
+from types import MappingProxyType
+from typing import Callable, Optional
+
+try:
+    import orjson
+except ImportError:  # optional speedup, fall back to stdlib json
+    orjson = None
+
+try:
+    import re2 as _re
+except ImportError:  # optional, guarantees linear-time matching
+    import re as _re
 
 __version__ = "1.2.0"
 
@@ -30,6 +36,77 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Current OS, normalized to the keys used by the path tables below.
+# sys.platform is already set, so this avoids importing `platform` at startup.
+_SYSTEM: str = {"win32": "windows"}.get(sys.platform, sys.platform)
+
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers catch either
+_json_loads = orjson.loads if orjson else json.loads
+
+# Matches a string literal (group 1, kept) or a // or /* */ comment (dropped).
+# Every branch has a single forward path, so matching is linear in input size.
+# The pattern avoids lookarounds so it also compiles under RE2.
+_JSONC_PATTERN = r'("(?:\\.|[^"\\])*"?)|//[^\n]*|/\*[^*]*(?:\*+[^*/][^*]*)*\**/?'
+_JSONC_RE = _re.compile(_JSONC_PATTERN)
+# Same pattern over raw UTF-8 bytes; the delimiters are ASCII and never occur
+# inside a multi-byte sequence, so files can be stripped without decoding
+_JSONC_BYTES_RE = _re.compile(_JSONC_PATTERN.encode("ascii"))
+
+# Expected types for known policies
+_EXPECTED_TYPES = MappingProxyType({
+    # Booleans
+    "BraveAIChatEnabled": bool,
+    "BlockThirdPartyCookies": bool,
+    "MetricsReportingEnabled": bool,
+    "SyncDisabled": bool,
+    "PasswordManagerEnabled": bool,
+    "TranslateEnabled": bool,
+    "SpellcheckEnabled": bool,
+    "QuicAllowed": bool,
+    "AutoplayAllowed": bool,
+    "ComponentUpdatesEnabled": bool,
+    # Integers
+    "SafeBrowsingProtectionLevel": int,
+    "HelpMeWriteSettings": int,
+    "GeminiSettings": int,
+    "GenAiDefaultSettings": int,
+    "DefaultCookiesSetting": int,
+    "DefaultGeolocationSetting": int,
+    "DefaultNotificationsSetting": int,
+    "BrowserSignin": int,
+    "DiskCacheSize": int,
+    # Strings
+    "WebRtcIPHandling": str,
+    "DnsOverHttpsMode": str,
+    # Lists
+    "CookiesSessionOnlyForUrls": list,
+})
+
+# Policy file location per OS
+_POLICY_PATHS: dict[str, Path] = {
+    "windows": Path(r"C:\Program Files\BraveSoftware\Brave-Browser\Application\policy\managed\policies.json"),
+    "linux": Path("/etc/brave/policies/managed/policies.json"),
+    "darwin": Path.home() / "Library/Application Support/BraveSoftware/Brave-Browser/policies/managed/policies.json",
+}
+
+# Known Brave executable/app bundle locations per OS
+_BRAVE_PATHS: dict[str, tuple[Path, ...]] = {
+    "windows": (
+        Path(r"C:\Program Files\BraveSoftware\Brave-Browser\Application\brave.exe"),
+        Path(r"C:\Program Files (x86)\BraveSoftware\Brave-Browser\Application\brave.exe"),
+    ),
+    "linux": (
+        Path("/usr/bin/brave"),
+        Path("/usr/bin/brave-browser"),
+        Path("/snap/bin/brave"),
+        Path("/opt/brave.com/brave/brave"),
+    ),
+    "darwin": (
+        Path("/Applications/Brave Browser.app"),
+        Path.home() / "Applications/Brave Browser.app",
+    ),
+}
+
 
 def get_policy_paths() -> dict[str, Path]:
     """
@@ -38,13 +115,30 @@ def get_policy_paths() -> dict[str, Path]:
     Returns:
         Dictionary mapping OS names to their policy paths.
     """
-    return {
-        "windows": Path(r"C:\Program Files\BraveSoftware\Brave-Browser\Application\policy\managed\policies.json"),
-        "linux": Path("/etc/brave/policies/managed/policies.json"),
-        "darwin": Path.home() / "Library/Application Support/BraveSoftware/Brave-Browser/policies/managed/policies.json",
-    }
+    return _POLICY_PATHS
 
 def is_brave_flatpak() -> bool:
+    """
+    Check if Brave is installed as a Flatpak.
+    
+    Looks for the Flatpak app directories first and only spawns
+    `flatpak info` when neither exists and the flatpak binary is available.
+    
+    Returns:
+        True if the Brave Flatpak is installed, False otherwise.
+    """
+    # System and user installation dirs; ~/.var/app is per-app data that
+    # survives `flatpak uninstall`, so it does not mean Brave is installed
+    if (Path("/var/lib/flatpak/app/com.brave.Browser").exists()
+            or (Path.home() / ".local/share/flatpak/app/com.brave.Browser").exists()):
+        return True
+    
+    import shutil
+    import subprocess
+    
+    if not shutil.which("flatpak"):
+        return False
+    
     try:
         result = subprocess.run(
             ["flatpak", "info", "com.brave.Browser"],
@@ -57,15 +151,14 @@ def is_brave_flatpak() -> bool:
 
 def ask_yes_no(msg: str) -> bool:
     """Ask user a yes/no question via input and return True for 'y'."""
-    response = input(f"{msg} [y/N]: ").strip().lower()
-    if response == "y":
-        logger.debug(f"User answered YES to: {msg}")
-    else:
-        logger.debug(f"User answered NO to: {msg}")
-    return response == "y"
+    answer = input(f"{msg} [y/N]: ").strip().lower() == "y"
+    logger.debug("User answered %s to: %s", "YES" if answer else "NO", msg)
+    return answer
 
 def grant_flatpak_permission():
     """Grant Brave Flatpak access to /etc/brave using flatpak override."""
+    import subprocess
+    
     logger.info("Applying Flatpak override for Brave...")
     subprocess.run(
         [
@@ -79,6 +172,7 @@ def grant_flatpak_permission():
     )
     logger.info("Flatpak permission granted.")
 
+@functools.cache
 def get_policy_path() -> Path:
     """
     Get the policy file path for the current operating system.
@@ -89,28 +183,28 @@ def get_policy_path() -> Path:
     Raises:
         RuntimeError: If the OS is not supported.
     """
-    system = platform.system().lower()
     paths = get_policy_paths()
     
-    if system not in paths:
+    if _SYSTEM not in paths:
         raise RuntimeError(
-            f"Unsupported operating system: {system}. "
+            f"Unsupported operating system: {_SYSTEM}. "
             f"Supported: {', '.join(paths.keys())}"
         )
     
-    return paths[system]
+    return paths[_SYSTEM]
 
 
+@functools.cache
 def check_permissions() -> bool:
     """
     Check if the script has sufficient permissions to write policies.
     
+    The result is cached, since privileges do not change during a run.
+    
     Returns:
         True if permissions are sufficient, False otherwise.
     """
-    system = platform.system().lower()
-    
-    if system == "windows":
+    if _SYSTEM == "windows":
         try:
             import ctypes
             return ctypes.windll.shell32.IsUserAnAdmin() != 0
@@ -129,27 +223,7 @@ def is_brave_installed() -> bool:
         - True if Brave appears to be installed
         - False otherwise
     """
-    system = platform.system().lower()
-    
-    brave_paths = {
-        "windows": [
-            Path(r"C:\Program Files\BraveSoftware\Brave-Browser\Application\brave.exe"),
-            Path(r"C:\Program Files (x86)\BraveSoftware\Brave-Browser\Application\brave.exe"),
-        ],
-        "linux": [
-            Path("/usr/bin/brave"),
-            Path("/usr/bin/brave-browser"),
-            Path("/snap/bin/brave"),
-            Path("/opt/brave.com/brave/brave"),
-        ],
-        "darwin": [
-            Path("/Applications/Brave Browser.app"),
-            Path.home() / "Applications/Brave Browser.app",
-        ],
-    }
-    
-    paths = brave_paths.get(system, [])
-    return any(p.exists() for p in paths)
+    return any(p.exists() for p in _BRAVE_PATHS.get(_SYSTEM, ()))
 
 
 def strip_json_comments(json_str: str) -> str:
@@ -165,17 +239,10 @@ def strip_json_comments(json_str: str) -> str:
     Returns:
         Clean JSON string without comments.
     """
-    # Pattern to match strings, single-line comments, or multi-line comments
-    pattern = r'("(?:[^"\\]|\\.)*")|//[^\n]*|/\*[\s\S]*?\*/'
-    
-    def replacer(match: re.Match) -> str:
-        # If it's a string (group 1), keep it
-        if match.group(1):
-            return match.group(1)
-        # Otherwise it's a comment, remove it
-        return ''
+    if '//' not in json_str and '/*' not in json_str:
+        return json_str
     
-    return re.sub(pattern, replacer, json_str)
+    return _JSONC_RE.sub(lambda m: m.group(1) or '', json_str)
 
 
 def ensure_dir(path: Path) -> None:
@@ -197,11 +264,13 @@ def create_backup(path: Path) -> Optional[Path]:
         logger.info("No existing policies file to backup")
         return None
     
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    import shutil
+    
+    timestamp = time.strftime("%Y%m%d_%H%M%S")
     backup_path = path.with_suffix(f".backup_{timestamp}")
     
-    shutil.copy2(path, backup_path)
-    logger.info(f"Backup created: {backup_path}")
+    shutil.copyfile(path, backup_path)
+    logger.info("Backup created: %s", backup_path)
     return backup_path
 
 
@@ -215,9 +284,16 @@ def find_latest_backup(path: Path) -> Optional[Path]:
     Returns:
         Path to the latest backup, or None if no backups exist.
     """
-    backup_pattern = f"{path.stem}.backup_*"
-    backups = sorted(path.parent.glob(backup_pattern), reverse=True)
-    return backups[0] if backups else None
+    # Timestamps are zero-padded, so the lexicographic max is the newest backup
+    prefix = f"{path.stem}.backup_"
+    try:
+        entries = os.scandir(path.parent)
+    except FileNotFoundError:
+        return None
+    
+    with entries:
+        latest = max((e.name for e in entries if e.name.startswith(prefix)), default=None)
+    return path.parent / latest if latest else None
 
 
 def restore_backup(path: Path) -> bool:
@@ -230,14 +306,16 @@ def restore_backup(path: Path) -> bool:
     Returns:
         True if restore was successful, False otherwise.
     """
+    import shutil
+    
     backup = find_latest_backup(path)
     
     if not backup:
         logger.error("No backup found to restore")
         return False
     
-    shutil.copy2(backup, path)
-    logger.info(f"Restored from: {backup}")
+    shutil.copyfile(backup, path)
+    logger.info("Restored from: %s", backup)
     return True
 
 
@@ -357,11 +435,14 @@ def load_local_json(path: Path) -> dict:
         RuntimeError: If loading fails.
     """
     try:
-        with path.open("r", encoding="utf-8") as f:
-            content = f.read()
+        with path.open("rb") as f:
+            data = f.read()
+        # Plain JSON can be parsed straight from bytes, skipping decode and strip
+        if b'//' not in data and b'/*' not in data:
+            return _json_loads(data)
         # Strip comments for JSONC support (JSON does not support comments by default)
-        clean_json = strip_json_comments(content)
-        return json.loads(clean_json)
+        clean_json = _JSONC_BYTES_RE.sub(lambda m: m.group(1) or b'', data)
+        return _json_loads(clean_json)
     except FileNotFoundError:
         raise RuntimeError(f"File not found: {path}")
     except json.JSONDecodeError as e:
@@ -384,44 +465,17 @@ def validate_policies(policies: dict) -> list[str]:
         warnings.append("Policies must be a JSON object")
         return warnings
     
-    # Expected types for known policies
-    expected_types = {
-        # Booleans
-        "BraveAIChatEnabled": bool,
-        "BlockThirdPartyCookies": bool,
-        "MetricsReportingEnabled": bool,
-        "SyncDisabled": bool,
-        "PasswordManagerEnabled": bool,
-        "TranslateEnabled": bool,
-        "SpellcheckEnabled": bool,
-        "QuicAllowed": bool,
-        "AutoplayAllowed": bool,
-        "ComponentUpdatesEnabled": bool,
-        # Integers
-        "SafeBrowsingProtectionLevel": int,
-        "HelpMeWriteSettings": int,
-        "GeminiSettings": int,
-        "GenAiDefaultSettings": int,
-        "DefaultCookiesSetting": int,
-        "DefaultGeolocationSetting": int,
-        "DefaultNotificationsSetting": int,
-        "BrowserSignin": int,
-        "DiskCacheSize": int,
-        # Strings
-        "WebRtcIPHandling": str,
-        "DnsOverHttpsMode": str,
-        # Lists
-        "CookiesSessionOnlyForUrls": list,
-    }
-    
     # Validate types for known policies
-    for key, expected_type in expected_types.items():
-        if key in policies:
-            value = policies[key]
-            if not isinstance(value, expected_type):
-                warnings.append(
-                    f"'{key}' should be {expected_type.__name__}, got {type(value).__name__}"
-                )
+    for key, value in policies.items():
+        expected_type = _EXPECTED_TYPES.get(key)
+        if expected_type is None:
+            continue
+        # bool is a subclass of int, so true/false must not pass as an int setting
+        if not isinstance(value, expected_type) or (
+                expected_type is int and isinstance(value, bool)):
+            warnings.append(
+                f"'{key}' should be {expected_type.__name__}, got {type(value).__name__}"
+            )
     
     # Check for potentially dangerous settings
     if policies.get("ComponentUpdatesEnabled") is False:
@@ -436,20 +490,50 @@ def write_json(path: Path, data: dict, dry_run: bool = False) -> None:
     """
     Write JSON data to a file.
     
+    The data is written to a temporary file next to the target and then
+    moved into place, so an interrupted write never leaves a partial file.
+    
     Args:
         path: Path to write to.
         data: Dictionary to write as JSON.
         dry_run: If True, only simulate the write.
     """
     if dry_run:
-        logger.info(f"[DRY-RUN] Would write to: {path}")
-        logger.info(f"[DRY-RUN] Content preview:\n{json.dumps(data, indent=2)[:500]}...")
+        logger.info("[DRY-RUN] Would write to: %s", path)
+        # Only encode as much as the preview shows, regardless of input size
+        chunks = []
+        size = 0
+        for chunk in json.JSONEncoder(indent=2, ensure_ascii=False).iterencode(data):
+            chunks.append(chunk)
+            size += len(chunk)
+            if size >= 500:
+                break
+        logger.info("[DRY-RUN] Content preview:\n%s...", "".join(chunks)[:500])
         return
     
+    if orjson:
+        blob = orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    else:
+        blob = json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8")
+    
+    import shutil
+    
     ensure_dir(path)
-    with path.open("w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
-    logger.info(f"Policies written to: {path}")
+    tmp_path = path.with_suffix(path.suffix + ".tmp")
+    try:
+        with tmp_path.open("wb") as f:
+            f.write(blob)
+        # os.replace installs a new inode, so carry over the old file's mode
+        # (or use a world-readable one) rather than inheriting a strict umask
+        if path.exists():
+            shutil.copymode(path, tmp_path)
+        else:
+            os.chmod(tmp_path, 0o644)
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+    logger.info("Policies written to: %s", path)
 
 
 def parse_args() -> argparse.Namespace:
@@ -550,10 +634,16 @@ def main() -> int:
         
         target_path = get_policy_path()
         
-        def apply_callback(policies: dict, dry_run: bool):
+        def apply_callback(policies: dict, dry_run: bool,
+                           progress_cb: Optional[Callable[[int, int, str], None]] = None):
+            report = progress_cb or (lambda done, total, stage: None)
+            total = len(policies)
             if args.backup and not dry_run:
+                report(0, total, "Creating backup...")
                 create_backup(target_path)
+            report(0, total, "Writing configuration...")
             write_json(target_path, policies, dry_run=dry_run)
+            report(total, total, "Done")
         
         def backup_callback():
             create_backup(target_path)
@@ -567,7 +657,7 @@ def main() -> int:
     
     try:
         target_path = get_policy_path()
-        logger.debug(f"Target path: {target_path}")
+        logger.debug("Target path: %s", target_path)
         
         # Handle restore mode
         if args.restore:
@@ -591,10 +681,10 @@ def main() -> int:
         
         # Load policies
         if args.local:
-            logger.info(f"Loading policies from: {args.local}")
+            logger.info("Loading policies from: %s", args.local)
             policies = load_local_json(args.local)
         else:
-            logger.info(f"Downloading policies from: {SOURCE_URL}")
+            logger.info("Using built-in policy set")
             policies = download_json(None)
         
         # Validate policies
@@ -610,7 +700,7 @@ def main() -> int:
         write_json(target_path, policies, dry_run=args.dry_run)
         
         # Flatpak support (Linux only)
-        if platform.system().lower() == "linux" and is_brave_flatpak():
+        if _SYSTEM == "linux" and is_brave_flatpak():
             logger.info("Brave is installed as a Flatpak.")
             if ask_yes_no("Grant Flatpak access to /etc/brave so policies can be applied?"):
                 grant_flatpak_permission()
@@ -636,7 +726,7 @@ def main() -> int:
         logger.info("\nOperation cancelled.")
         return 130
     except Exception as e:
-        logger.exception(f"Unexpected error: {e}")
+        logger.exception("Unexpected error: %s", e)
         return 1
 
 if __name__ == "__main__":
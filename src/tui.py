@@ -5,19 +5,41 @@ ZeroBrave TUI - Interactive Terminal User Interface.
 Professional look with ASCII symbols, animations, profiles, and help system.
 """
 
-from dataclasses import dataclass
-from typing import Callable
+from collections import ChainMap
+from collections.abc import Mapping
+from types import MappingProxyType
+from typing import Callable, NamedTuple, Optional
+import codecs
+import functools
 import json
 import os
+import select
+import sys
 import time
 
 from rich.console import Console
 from rich.panel import Panel
 from rich.table import Table
+from rich.style import Style
 from rich.text import Text
-from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn
 from rich import box
 
+try:
+    import orjson
+except ImportError:  # optional speedup, fall back to stdlib json
+    orjson = None
+
+try:
+    import termios
+    import tty
+except ImportError:  # Windows
+    termios = tty = None
+
+try:
+    import msvcrt
+except ImportError:  # POSIX
+    msvcrt = None
+
 # 3D ASCII Banner
 BANNER = """[bold cyan]
  ███████╗███████╗██████╗  ██████╗ ██████╗ ██████╗  █████╗ ██╗   ██╗███████╗
@@ -29,27 +51,76 @@ BANNER = """[bold cyan]
                     [bold yellow]Privacy-First Brave Configuration[/]
 """
 
-# Predefined profiles
-PROFILES = {
-    "strict": {
+# Command bar shown under the categories table
+COMMANDS = (
+    "[cyan]1-8[/] Toggle  |  "
+    "[cyan]S[/]trict [cyan]B[/]alanced [cyan]M[/]inimal  |  "
+    "[cyan]?[/] Help  |  "
+    "[cyan]A[/]ll  |  "
+    "[cyan]P[/]review  |  "
+    "[green]ENTER[/] Apply  |  "
+    "[red]Q[/]uit"
+)
+
+# General help screen
+HELP_TEXT = """
+[bold cyan]ZeroBrave TUI - Help[/]
+
+[bold]Navigation:[/]
+  [cyan]1-8[/]      Toggle individual categories ON/OFF
+  [cyan]S[/]        Apply 'Strict' profile (maximum privacy)
+  [cyan]B[/]        Apply 'Balanced' profile (privacy + convenience)
+  [cyan]M[/]        Apply 'Minimal' profile (essential only)
+  [cyan]A[/]        Toggle ALL categories ON/OFF
+  [cyan]P[/]        Preview JSON policies
+  [cyan]ENTER[/]    Apply policies to Brave
+  [cyan]Q[/]        Quit without applying
+  [cyan]?[/]        Show this help
+  [cyan]?1-8[/]     Show help for specific category
+
+[bold]Profiles:[/]
+  [green]Strict[/]    - All 8 categories enabled (maximum privacy)
+  [yellow]Balanced[/]  - 6 categories (keeps autofill, permissions optional)
+  [dim]Minimal[/]   - 3 categories (AI, telemetry, Brave-specific only)
+
+[bold]Tips:[/]
+  • Changes require restarting Brave to take effect
+  • Use --dry-run to preview without applying
+  • Policies are enforced and cannot be changed by users
+"""
+
+# Predefined profiles (read-only, so TUI instances can safely share them)
+PROFILES = MappingProxyType({
+    "strict": MappingProxyType({
         "name": "Strict",
         "desc": "Maximum privacy - all protections enabled",
-        "categories": ["ai", "privacy", "telemetry", "security", "autofill", "sync", "perms", "brave"]
-    },
-    "balanced": {
+        "categories": ("ai", "privacy", "telemetry", "security", "autofill", "sync", "perms", "brave")
+    }),
+    "balanced": MappingProxyType({
         "name": "Balanced",
         "desc": "Good privacy with some convenience",
-        "categories": ["ai", "privacy", "telemetry", "security", "sync", "brave"]
-    },
-    "minimal": {
+        "categories": ("ai", "privacy", "telemetry", "security", "sync", "brave")
+    }),
+    "minimal": MappingProxyType({
         "name": "Minimal",
         "desc": "Basic privacy - only essentials",
-        "categories": ["ai", "telemetry", "brave"]
-    },
-}
+        "categories": ("ai", "telemetry", "brave")
+    }),
+})
+
+
+class Category(NamedTuple):
+    """A policy category, shown as one row of the TUI table."""
+    key: str
+    tag: str
+    name: str
+    desc: str
+    help_text: str
+    policies: Mapping[str, object]
+
 
 # Categories with ASCII tags and help text
-CATEGORIES = [
+_CATEGORY_ROWS = [
     ("ai", "[AI]", "Disable AI Features", "Leo, Gemini, Lens, AI Writing", 
      "Disables all AI assistants including Leo (Brave's AI), Google Gemini integration, "
      "Google Lens features, and AI-powered writing helpers.", {
@@ -145,6 +216,260 @@ CATEGORIES = [
     }),
 ]
 
+# Immutable, so the policy mappings can be shared by merged views and caches
+CATEGORIES = tuple(
+    Category(key, tag, name, desc, help_text, MappingProxyType(policies))
+    for key, tag, name, desc, help_text, policies in _CATEGORY_ROWS
+)
+
+# Per-category policies and sizes, precomputed for build/count and
+# index-aligned with CATEGORIES
+_CAT_POLICIES = tuple((cat.key, cat.policies) for cat in CATEGORIES)
+_CAT_SIZES = tuple(len(cat.policies) for cat in CATEGORIES)
+
+# Bit assigned to each category in the enabled mask (bit i = category i+1)
+_CAT_BITS = {cat.key: 1 << i for i, cat in enumerate(CATEGORIES)}
+_ALL_ENABLED = (1 << len(CATEGORIES)) - 1
+
+
+def _build_help(cat: Category) -> str:
+    """Help panel body for a category, listing up to 10 of its policies."""
+    return (
+        f"[bold]{cat.tag} {cat.name}[/]\n\n"
+        f"{cat.help_text}\n\n"
+        f"[dim]Policies ({len(cat.policies)}):[/]\n" +
+        "\n".join(f"  • {p}" for p in list(cat.policies)[:10]) +
+        ("\n  ..." if len(cat.policies) > 10 else "")
+    )
+
+
+# Category help bodies, index-aligned with CATEGORIES
+_CAT_HELP_BODY = tuple(_build_help(cat) for cat in CATEGORIES)
+
+# Shortest interval between redraws while keys are queued (60 Hz)
+_MIN_FRAME_INTERVAL = 1 / 60
+
+# Enabled mask for each profile
+_PROFILE_MASKS = {
+    key: sum(_CAT_BITS[cat] for cat in profile["categories"])
+    for key, profile in PROFILES.items()
+}
+
+# Static renderables and panel styles, built once at import instead of per render
+_BANNER_TEXT = Text.from_markup(BANNER)
+_BANNER_PLAIN = """
+ ███████╗███████╗██████╗  ██████╗ ██████╗ ██████╗  █████╗ ██╗   ██╗███████╗
+ ╚══███╔╝██╔════╝██╔══██╗██╔═══██╗██╔══██╗██╔══██╗██╔══██╗██║   ██║██╔════╝
+   ███╔╝ █████╗  ██████╔╝██║   ██║██████╔╝██████╔╝███████║██║   ██║█████╗  
+  ███╔╝  ██╔══╝  ██╔══██╗██║   ██║██╔══██╗██╔══██╗██╔══██║╚██╗ ██╔╝██╔══╝  
+ ███████╗███████╗██║  ██║╚██████╔╝██████╔╝██║  ██║██║  ██║ ╚████╔╝ ███████╗
+ ╚══════╝╚══════╝╚═╝  ╚═╝ ╚═════╝ ╚═════╝ ╚═╝  ╚═╝╚═╝  ╚═╝  ╚═══╝  ╚══════╝
+                    Privacy-First Brave Configuration
+"""
+_BANNER_LINES = tuple(Text(line, style="bold cyan") for line in _BANNER_PLAIN.strip().split("\n"))
+_CMD_PANEL = Panel(
+    Text.from_markup(COMMANDS),
+    title="[bold]Commands[/]",
+    border_style="dim cyan",
+    box=box.ROUNDED,
+)
+_HELP_PANEL = Panel(Text.from_markup(HELP_TEXT), title="[bold]Help[/]", border_style="cyan")
+_RESTART_PANEL = Panel(
+    Text.from_markup("[bold]Remember to restart Brave for changes to take effect![/]"),
+    border_style="cyan",
+    box=box.ROUNDED,
+)
+_STATUS_PANEL_STYLE = dict(box=box.MINIMAL)
+_CAT_HELP_PANEL_STYLE = dict(border_style=Style.parse("cyan"))
+_PREVIEW_PANEL_STYLE = dict(border_style=Style.parse("yellow"), box=box.DOUBLE)
+_SUCCESS_PANEL_STYLE = dict(border_style=Style.parse("green"), box=box.DOUBLE)
+
+# Table cell styles, parsed once instead of from strings on every sync
+_STYLES = {
+    "on": Style.parse("bold green"),
+    "off": Style.parse("dim red"),
+    "tag_on": Style.parse("cyan"),
+    "tag_off": Style.parse("dim"),
+}
+
+
+def _dumps(policies: dict) -> str:
+    """Pretty-print policies as JSON, using orjson when available."""
+    if orjson:
+        return orjson.dumps(policies, option=orjson.OPT_INDENT_2).decode()
+    return json.dumps(policies, indent=2)
+
+
+def _popcount(mask: int) -> int:
+    """Number of set bits (int.bit_count() needs Python 3.10)."""
+    return bin(mask).count("1")
+
+
+@functools.lru_cache(maxsize=1 << len(CATEGORIES))
+def _render_policies(mask: int) -> tuple[dict, str]:
+    """Merged policies and their pretty JSON for an enabled-category bitmask."""
+    policies = {}
+    for i, (_, cat_policies) in enumerate(_CAT_POLICIES):
+        if mask >> i & 1:
+            policies.update(cat_policies)
+    return policies, _dumps(policies)
+
+
+class _CharReader:
+    """Read commands one keypress at a time, without waiting for ENTER.
+    
+    Puts the terminal in cbreak mode (POSIX) or uses msvcrt (Windows) while
+    active. When stdin is not an interactive terminal (pipes, tests) it falls
+    back to line-buffered input(), so scripted input keeps working.
+    """
+    
+    # How long to wait for the digit after '?' before showing general help
+    HELP_DIGIT_TIMEOUT = 0.5
+    
+    def __init__(self, stream=None):
+        self.stream = stream or sys.stdin
+        self.raw = bool(termios or msvcrt) and self.stream.isatty()
+        self._windows = msvcrt is not None and termios is None
+        self._saved = None
+        self._pending = ""  # Key read while peeking after '?'
+        self._decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+    
+    def __enter__(self):
+        if self.raw and termios:
+            fd = self.stream.fileno()
+            self._saved = termios.tcgetattr(fd)
+            tty.setcbreak(fd)
+        return self
+    
+    def __exit__(self, *exc):
+        if self._saved is not None:
+            termios.tcsetattr(self.stream.fileno(), termios.TCSADRAIN, self._saved)
+            self._saved = None
+    
+    def _getch(self, timeout: float = None) -> Optional[str]:
+        """Read one key.
+        
+        Returns:
+            The character read, '' if `timeout` seconds pass first, or None
+            at end of input.
+        """
+        if self._windows:
+            if timeout is not None:
+                deadline = time.monotonic() + timeout
+                while not msvcrt.kbhit():
+                    if time.monotonic() >= deadline:
+                        return ""
+                    time.sleep(0.01)
+            return msvcrt.getwch()
+        
+        fd = self.stream.fileno()
+        if timeout is not None and not select.select([fd], [], [], timeout)[0]:
+            return ""
+        # Unbuffered reads, so a pending key is never hidden from select()
+        # inside the text wrapper's buffer; multi-byte UTF-8 keys are
+        # accumulated until they decode to a character
+        while True:
+            byte = os.read(fd, 1)
+            if not byte:
+                return None
+            char = self._decoder.decode(byte)
+            if char:
+                return char
+    
+    def _skip_escape_sequence(self):
+        """Discard the rest of an ESC sequence (arrow, function keys) already queued."""
+        fd = self.stream.fileno()
+        
+        def next_byte() -> bytes:
+            return os.read(fd, 1) if select.select([fd], [], [], 0)[0] else b""
+        
+        kind = next_byte()
+        if kind == b"[":  # CSI: parameters, then a final byte in @..~
+            while True:
+                byte = next_byte()
+                if not byte or 0x40 <= byte[0] <= 0x7E:
+                    return
+        elif kind == b"O":  # SS3: one more byte
+            next_byte()
+    
+    def pending(self) -> bool:
+        """Whether another key is already waiting to be read."""
+        if not self.raw:
+            return False
+        if self._pending:
+            return True
+        if self._windows:
+            return msvcrt.kbhit()
+        return bool(select.select([self.stream.fileno()], [], [], 0)[0])
+    
+    def wait_enter(self, prompt: str):
+        """Wait for ENTER, ignoring other keys.
+        
+        Reads through the same unbuffered path as read_command(), so keys
+        typed afterwards are not stranded in sys.stdin's buffer. End of input
+        returns quietly; the next read_command() reports it.
+        
+        Raises:
+            KeyboardInterrupt: If Ctrl-C is pressed.
+        """
+        if not self.raw:
+            try:
+                input(prompt)
+            except EOFError:
+                pass
+            return
+        
+        sys.stdout.write(prompt)
+        sys.stdout.flush()
+        while True:
+            key = self._getch()
+            if key is None or key in ("\r", "\n"):
+                break
+            if key == "\x03":
+                raise KeyboardInterrupt
+        sys.stdout.write("\n")
+        sys.stdout.flush()
+    
+    def read_command(self, prompt: str) -> str:
+        """Read a command: a single key, '?' plus a digit, or '' for ENTER.
+        
+        Raises:
+            EOFError: If stdin is closed or Ctrl-D is pressed.
+            KeyboardInterrupt: If Ctrl-C is pressed.
+        """
+        if not self.raw:
+            return input(prompt).strip().lower()
+        
+        sys.stdout.write(prompt)
+        sys.stdout.flush()
+        
+        key, self._pending = self._pending or self._getch(), ""
+        if key is None or key == "\x04":
+            raise EOFError
+        if key == "\x03":
+            raise KeyboardInterrupt
+        if key in ("\r", "\n"):
+            key = ""
+        elif self._windows and key in ("\x00", "\xe0"):  # arrow/function key prefix
+            self._getch()
+            key = "\x00"
+        elif key == "\x1b":  # ESC; on POSIX also the start of arrow/function keys
+            if not self._windows:
+                self._skip_escape_sequence()
+            key = "\x00"
+        elif key == "?":
+            follow = self._getch(timeout=self.HELP_DIGIT_TIMEOUT)
+            if follow and "0" <= follow <= "9":
+                key += follow
+            elif follow not in (None, "\r", "\n"):
+                # Keep any other key for the next command. ENTER is dropped: after
+                # '?' it is the line-mode habit, not a request to apply policies.
+                self._pending = follow
+        
+        sys.stdout.write(key.strip("\x00") + "\n")
+        sys.stdout.flush()
+        return key.lower()
+
 
 class TUI:
     """Professional TUI with profiles, help, and animations."""
@@ -157,43 +482,76 @@ class TUI:
         self.dry_run = dry_run
         self.backup_callback = backup_callback
         self.apply_callback = apply_callback
-        self.enabled = {cat[0]: True for cat in CATEGORIES}
+        self._reader = _CharReader()  # Puts the terminal in cbreak mode only inside run()
+        self.reset()
+        
+        # Skip animation delays when nobody can see them (pipes, CI, tests)
+        self._animate = self.console.is_terminal and not os.environ.get("ZEROBRAVE_NO_ANIM")
+        self._sleep = time.sleep if self._animate else (lambda _: None)
+        
+        # Pre-formatted toggle feedback lines, written without going through rich.
+        # Legacy Windows consoles colour via the win32 API, so they get plain text.
+        console = self.console
+        if console.color_system and not console.no_color and not console.legacy_windows:
+            on, off = "\x1b[32mON\x1b[0m", "\x1b[31mOFF\x1b[0m"
+        else:
+            on, off = "ON", "OFF"
+        self._feedback_on = [f"  {cat.tag} -> {on}\n" for cat in CATEGORIES]
+        self._feedback_off = [f"  {cat.tag} -> {off}\n" for cat in CATEGORIES]
+        
+        # Profiles bar markup for each possible current profile, one print per render
+        self._profile_bars = {
+            current: "[bold]Profiles:[/] " + "  ".join(
+                f"[bold green][{key[0].upper()}] {data['name']}[/]" if key == current
+                else f"[dim][{key[0].upper()}] {data['name']}[/]"
+                for key, data in PROFILES.items()
+            ) + "\n"
+            for current in (*PROFILES, "custom")
+        }
+        
+        self._table = self._build_table_skeleton()
+    
+    def reset(self):
+        """Return to the initial session state: strict profile, no changes, no pacing history."""
+        self._mask = _ALL_ENABLED  # Bit i set = category i+1 enabled
         self.current_profile = "strict"  # Default profile
         self.changes_made = 0  # Track changes this session
+        
+        # Frame pacing: skip redraws between queued keys, widening the interval
+        # on terminals where a render takes longer than a 60 Hz frame
+        self._last_render = 0.0
+        self._render_ema = 0.0
+        self._frame_interval = _MIN_FRAME_INTERVAL
     
     def clear(self):
         """Clear screen."""
-        os.system('clear' if os.name != 'nt' else 'cls')
+        # Rich emits the escape codes itself (or uses the win32 API on legacy
+        # Windows consoles), so no clear/cls process is spawned per render
+        self.console.clear()
     
     def animate_banner(self):
         """Animate the banner appearing."""
-        banner_plain = """
- ███████╗███████╗██████╗  ██████╗ ██████╗ ██████╗  █████╗ ██╗   ██╗███████╗
- ╚══███╔╝██╔════╝██╔══██╗██╔═══██╗██╔══██╗██╔══██╗██╔══██╗██║   ██║██╔════╝
-   ███╔╝ █████╗  ██████╔╝██║   ██║██████╔╝██████╔╝███████║██║   ██║█████╗  
-  ███╔╝  ██╔══╝  ██╔══██╗██║   ██║██╔══██╗██╔══██╗██╔══██║╚██╗ ██╔╝██╔══╝  
- ███████╗███████╗██║  ██║╚██████╔╝██████╔╝██║  ██║██║  ██║ ╚████╔╝ ███████╗
- ╚══════╝╚══════╝╚═╝  ╚═╝ ╚═════╝ ╚═════╝ ╚═╝  ╚═╝╚═╝  ╚═╝  ╚═══╝  ╚══════╝
-                    Privacy-First Brave Configuration
-"""
-        for line in banner_plain.strip().split('\n'):
-            self.console.print(f"[bold cyan]{line}[/]")
-            time.sleep(0.04)
+        for line in _BANNER_LINES:
+            self.console.print(line)
+            self._sleep(0.04)
     
     def animate_intro(self):
         """Animate program startup."""
         self.clear()
         
-        with Progress(
-            SpinnerColumn("dots12"),
-            TextColumn("[bold cyan]Initializing ZeroBrave...[/]"),
-            transient=True,
-        ) as progress:
-            progress.add_task("", total=None)
-            time.sleep(0.8)
+        if self._animate:
+            from rich.progress import Progress, SpinnerColumn, TextColumn
+            
+            with Progress(
+                SpinnerColumn("dots12"),
+                TextColumn("[bold cyan]Initializing ZeroBrave...[/]"),
+                transient=True,
+            ) as progress:
+                progress.add_task("", total=None)
+                self._sleep(0.8)
         
         self.animate_banner()
-        time.sleep(0.3)
+        self._sleep(0.3)
     
     def animate_exit(self):
         """Animate program exit."""
@@ -205,48 +563,59 @@ class TUI:
             "[bold cyan]Goodbye![/]",
         ]
         
-        for msg in messages:
-            self.console.print(f"  {msg}")
-            time.sleep(0.15)
+        if self._animate:
+            for msg in messages:
+                self.console.print(f"  {msg}")
+                self._sleep(0.15)
+        else:
+            self.console.print("\n".join(f"  {msg}" for msg in messages))
         
         self.console.print()
-        self.console.print(Panel(
-            "[bold]Remember to restart Brave for changes to take effect![/]",
-            border_style="cyan",
-            box=box.ROUNDED,
-        ))
-        time.sleep(0.3)
+        self.console.print(_RESTART_PANEL)
+        self._sleep(0.3)
+    
+    @property
+    def enabled(self) -> Mapping[str, bool]:
+        """Read-only snapshot of category key -> enabled."""
+        return MappingProxyType({key: bool(self._mask & bit) for key, bit in _CAT_BITS.items()})
+    
+    @enabled.setter
+    def enabled(self, states: Mapping[str, bool]):
+        self._mask = sum(bit for key, bit in _CAT_BITS.items() if states.get(key))
     
     def apply_profile(self, profile_key: str):
         """Apply a predefined profile."""
-        if profile_key not in PROFILES:
+        new_mask = _PROFILE_MASKS.get(profile_key)
+        if new_mask is None:
             return
         
-        profile = PROFILES[profile_key]
-        enabled_cats = profile["categories"]
-        
-        for cat_key, *_ in CATEGORIES:
-            old_state = self.enabled[cat_key]
-            new_state = cat_key in enabled_cats
-            if old_state != new_state:
-                self.changes_made += 1
-            self.enabled[cat_key] = new_state
-        
+        self.changes_made += _popcount(self._mask ^ new_mask)
+        self._mask = new_mask
         self.current_profile = profile_key
     
     def build_policies(self) -> dict:
         """Build policies dict from enabled categories."""
         result = {}
-        for key, tag, name, desc, help_text, policies in CATEGORIES:
-            if self.enabled[key]:
+        for i, (_, policies) in enumerate(_CAT_POLICIES):
+            if self._mask >> i & 1:
                 result.update(policies)
         return result
     
+    def build_policies_view(self) -> ChainMap:
+        """Read-only merged view of enabled categories, without copying."""
+        # Reversed so lookup precedence and key order match build_policies()
+        return ChainMap(*reversed(
+            [p for i, (_, p) in enumerate(_CAT_POLICIES) if self._mask >> i & 1]
+        ))
+    
+    def enabled_mask(self) -> int:
+        """Enabled categories as a bitmask (bit i set = category i+1 on)."""
+        return self._mask
+    
     def count_enabled(self) -> tuple[int, int]:
         """Count (enabled_categories, total_policies)."""
-        enabled = sum(1 for k, v in self.enabled.items() if v)
-        policies = sum(len(cat[5]) for cat in CATEGORIES if self.enabled[cat[0]])
-        return enabled, policies
+        policies = sum(size for i, size in enumerate(_CAT_SIZES) if self._mask >> i & 1)
+        return _popcount(self._mask), policies
     
     def render_profiles(self) -> Table:
         """Render profile selector."""
@@ -266,8 +635,8 @@ class TUI:
         
         return table
     
-    def render_table(self):
-        """Render the categories table."""
+    def _build_table_skeleton(self) -> Table:
+        """Build the categories table once, keeping handles to its mutable cells."""
         table = Table(box=box.DOUBLE_EDGE, show_header=True, header_style="bold white")
         table.add_column("#", style="bold cyan", width=3, justify="center")
         table.add_column("Tag", style="bold", width=8)
@@ -275,31 +644,72 @@ class TUI:
         table.add_column("Category", width=20)
         table.add_column("Details", style="dim")
         
-        for i, (key, tag, name, desc, help_text, policies) in enumerate(CATEGORIES, 1):
-            if self.enabled[key]:
-                status = "[bold green]++ ON[/]"
-                tag_style = f"[cyan]{tag}[/]"
-            else:
-                status = "[dim red]-- OFF[/]"
-                tag_style = f"[dim]{tag}[/]"
-            
-            table.add_row(str(i), tag_style, status, name, desc)
-        
+        self._tag_cells = []
+        self._status_cells = []
+        for i, cat in enumerate(CATEGORIES, 1):
+            tag_cell = Text(cat.tag)
+            status_cell = Text()
+            self._tag_cells.append(tag_cell)
+            self._status_cells.append(status_cell)
+            table.add_row(str(i), tag_cell, status_cell, cat.name, cat.desc)
+        
+        # Last state written to each row; None forces the first sync
+        self._row_state = [None] * len(CATEGORIES)
         return table
     
+    def _sync_table(self) -> Table:
+        """Update only the rows whose ON/OFF state changed since the last render."""
+        for i in range(len(CATEGORIES)):
+            on = bool(self._mask >> i & 1)
+            if self._row_state[i] is on:
+                continue
+            self._status_cells[i].plain = "++ ON" if on else "-- OFF"
+            self._status_cells[i].style = _STYLES["on"] if on else _STYLES["off"]
+            self._tag_cells[i].style = _STYLES["tag_on"] if on else _STYLES["tag_off"]
+            self._row_state[i] = on
+        return self._table
+    
     def render(self, animate: bool = False):
         """Render the main screen."""
+        # Legacy Windows consoles are drawn through the win32 API, which
+        # captured output would bypass
+        if animate or self.console.legacy_windows:
+            self._render_frame(animate=animate)
+            return
+        
+        # Buffer the whole frame (clear included) and emit it in one write
+        with self.console.capture() as capture:
+            self._render_frame()
+        self.console.file.write(capture.get())
+        self.console.file.flush()
+    
+    def _frame_due(self, reader: _CharReader) -> bool:
+        """Whether to redraw now, or coalesce with the keys already queued."""
+        recent = time.monotonic() - self._last_render < self._frame_interval
+        return not (recent and reader.pending())
+    
+    def _paced_render(self):
+        """Render, tracking an EMA of render time to set the frame interval."""
+        start = time.monotonic()
+        self.render()
+        self._last_render = time.monotonic()
+        self._render_ema += 0.2 * (self._last_render - start - self._render_ema)
+        self._frame_interval = max(_MIN_FRAME_INTERVAL, 2 * self._render_ema)
+    
+    def _render_frame(self, animate: bool = False):
+        """Print the main screen to the console."""
         self.clear()
         
         if animate:
             self.animate_banner()
         else:
-            self.console.print(BANNER)
+            self.console.print(_BANNER_TEXT)
         
         enabled_cats, total_policies = self.count_enabled()
         
         # Status bar with profile and changes indicator
-        profile_name = PROFILES[self.current_profile]["name"]
+        profile = PROFILES.get(self.current_profile)
+        profile_name = profile["name"] if profile else "Custom"
         status_parts = [
             f"[bold]Profile: {profile_name}[/]",
             f"[bold]Categories: {enabled_cats}/8[/]",
@@ -312,154 +722,101 @@ class TUI:
         if self.dry_run:
             status_parts.insert(0, "[bold yellow]>> DRY-RUN <<[/]")
         
-        self.console.print(Panel(" | ".join(status_parts), box=box.MINIMAL))
+        self.console.print(Panel(" | ".join(status_parts), **_STATUS_PANEL_STYLE))
         self.console.print()
         
         # Profiles bar
-        self.console.print("[bold]Profiles:[/] ", end="")
-        for key, data in PROFILES.items():
-            letter = key[0].upper()  # S, B, M
-            if key == self.current_profile:
-                self.console.print(f"[bold green][{letter}] {data['name']}[/]", end="  ")
-            else:
-                self.console.print(f"[dim][{letter}] {data['name']}[/]", end="  ")
-        self.console.print("\n")
+        self.console.print(self._profile_bars[self.current_profile])
         
         # Categories table
-        self.console.print(self.render_table())
+        self.console.print(self._sync_table())
         self.console.print()
         
         # Commands
-        cmd_panel = Panel(
-            "[cyan]1-8[/] Toggle  |  "
-            "[cyan]S[/]trict [cyan]B[/]alanced [cyan]M[/]inimal  |  "
-            "[cyan]?[/] Help  |  "
-            "[cyan]A[/]ll  |  "
-            "[cyan]P[/]review  |  "
-            "[green]ENTER[/] Apply  |  "
-            "[red]Q[/]uit",
-            title="[bold]Commands[/]",
-            border_style="dim cyan",
-            box=box.ROUNDED,
-        )
-        self.console.print(cmd_panel)
+        self.console.print(_CMD_PANEL)
         self.console.print()
     
     def show_help(self, category_num: int = None):
         """Show contextual help."""
         self.clear()
-        self.console.print(BANNER)
+        self.console.print(_BANNER_TEXT)
         
         if category_num and 1 <= category_num <= 8:
             # Show specific category help
-            key, tag, name, desc, help_text, policies = CATEGORIES[category_num - 1]
-            
             self.console.print(Panel(
-                f"[bold]{tag} {name}[/]\n\n"
-                f"{help_text}\n\n"
-                f"[dim]Policies ({len(policies)}):[/]\n" +
-                "\n".join(f"  • {p}" for p in list(policies.keys())[:10]) +
-                ("\n  ..." if len(policies) > 10 else ""),
+                _CAT_HELP_BODY[category_num - 1],
                 title=f"[bold cyan]Help: Category {category_num}[/]",
-                border_style="cyan",
+                **_CAT_HELP_PANEL_STYLE,
             ))
         else:
             # Show general help
-            help_text = """
-[bold cyan]ZeroBrave TUI - Help[/]
-
-[bold]Navigation:[/]
-  [cyan]1-8[/]      Toggle individual categories ON/OFF
-  [cyan]S[/]        Apply 'Strict' profile (maximum privacy)
-  [cyan]B[/]        Apply 'Balanced' profile (privacy + convenience)
-  [cyan]M[/]        Apply 'Minimal' profile (essential only)
-  [cyan]A[/]        Toggle ALL categories ON/OFF
-  [cyan]P[/]        Preview JSON policies
-  [cyan]ENTER[/]    Apply policies to Brave
-  [cyan]Q[/]        Quit without applying
-  [cyan]?[/]        Show this help
-  [cyan]?1-8[/]     Show help for specific category
-
-[bold]Profiles:[/]
-  [green]Strict[/]    - All 8 categories enabled (maximum privacy)
-  [yellow]Balanced[/]  - 6 categories (keeps autofill, permissions optional)
-  [dim]Minimal[/]   - 3 categories (AI, telemetry, Brave-specific only)
-
-[bold]Tips:[/]
-  • Changes require restarting Brave to take effect
-  • Use --dry-run to preview without applying
-  • Policies are enforced and cannot be changed by users
-"""
-            self.console.print(Panel(help_text, title="[bold]Help[/]", border_style="cyan"))
+            self.console.print(_HELP_PANEL)
         
         self.console.print()
-        input("Press ENTER to go back...")
+        self._reader.wait_enter("Press ENTER to go back...")
     
     def show_preview(self):
         """Show JSON preview with animation."""
         self.clear()
-        self.console.print(BANNER)
+        self.console.print(_BANNER_TEXT)
         
-        policies = self.build_policies()
+        policies, json_str = _render_policies(self.enabled_mask())
         
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[bold cyan]Generating preview..."),
-            transient=True,
-        ) as progress:
-            progress.add_task("", total=None)
-            time.sleep(0.5)
-        
-        json_str = json.dumps(policies, indent=2)
+        if self._animate:
+            from rich.progress import Progress, SpinnerColumn, TextColumn
+            
+            with Progress(
+                SpinnerColumn(),
+                TextColumn("[bold cyan]Generating preview..."),
+                transient=True,
+            ) as progress:
+                progress.add_task("", total=None)
+                self._sleep(0.5)
         
         self.console.print(Panel(
             f"[cyan]{json_str}[/]",
             title=f"[bold yellow]<< {len(policies)} Policies >>[/]",
-            border_style="yellow",
-            box=box.DOUBLE,
+            **_PREVIEW_PANEL_STYLE,
         ))
         self.console.print()
-        input("Press ENTER to go back...")
+        self._reader.wait_enter("Press ENTER to go back...")
     
     def apply(self):
-        """Apply policies with progress animation."""
-        policies = self.build_policies()
-        _, total = self.count_enabled()
+        """Apply policies, showing the progress reported by the apply callback."""
+        # The callback may keep or write the mapping, so hand it a real dict
+        policies = dict(self.build_policies_view())
+        total = len(policies)
         
         self.console.print()
         
         if self.dry_run:
             self.console.print("[bold yellow]>> DRY-RUN: Simulating apply...[/]\n")
         
-        with Progress(
-            SpinnerColumn("dots"),
-            TextColumn("[bold]{task.description}"),
-            BarColumn(bar_width=40),
-            TextColumn("[bold cyan]{task.percentage:>3.0f}%"),
-        ) as progress:
-            task = progress.add_task("Applying policies...", total=100)
-            
-            for i in range(100):
-                time.sleep(0.015)
-                progress.update(task, advance=1)
-                
-                if i == 30:
-                    progress.update(task, description="Writing configuration...")
-                elif i == 60:
-                    progress.update(task, description="Validating policies...")
-                elif i == 90:
-                    progress.update(task, description="Finalizing...")
-        
         if self.apply_callback:
             try:
-                self.apply_callback(policies, self.dry_run)
+                if self.dry_run:
+                    self.apply_callback(policies, self.dry_run)
+                else:
+                    from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn
+                    
+                    with Progress(
+                        SpinnerColumn("dots"),
+                        TextColumn("[bold]{task.description}"),
+                        BarColumn(bar_width=40),
+                        TextColumn("[bold cyan]{task.percentage:>3.0f}%"),
+                    ) as progress:
+                        task = progress.add_task("Applying policies...", total=total)
+                        
+                        def report(done: int, total: int, stage: str):
+                            progress.update(task, completed=done, total=total, description=stage)
+                        
+                        self.apply_callback(policies, self.dry_run, progress_cb=report)
                 self.console.print()
                 self.console.print(Panel(
                     "[bold green]>>> SUCCESS <<<[/]\n\n"
                     f"Applied [cyan]{total}[/] policies.\n"
                     "[dim]Restart Brave for changes to take effect.[/]",
-                    border_style="green",
-                    box=box.DOUBLE,
+                    **_SUCCESS_PANEL_STYLE,
                 ))
                 self.changes_made = 0  # Reset changes counter
             except Exception as e:
@@ -468,65 +825,74 @@ class TUI:
             self.console.print("\n[yellow]Note: No apply callback configured[/]")
         
         self.console.print()
-        input("Press ENTER to continue...")
+        self._reader.wait_enter("Press ENTER to continue...")
     
     def toggle_with_feedback(self, idx: int):
         """Toggle a category with visual feedback."""
         if 1 <= idx <= 8:
-            key = CATEGORIES[idx - 1][0]
-            self.enabled[key] = not self.enabled[key]
+            i = idx - 1
+            self._mask ^= 1 << i
             self.changes_made += 1
             self.current_profile = "custom"  # No longer matches a profile
             
-            status = "[green]ON[/]" if self.enabled[key] else "[red]OFF[/]"
-            self.console.print(f"  {CATEGORIES[idx - 1][1]} -> {status}", highlight=False)
-            time.sleep(0.1)
+            feedback = self._feedback_on if self._mask >> i & 1 else self._feedback_off
+            self.console.file.write(feedback[i])
+            self.console.file.flush()
     
     def run(self):
         """Main loop."""
         self.animate_intro()
-        time.sleep(0.2)
+        self._sleep(0.2)
         
         first_render = False
         
-        while True:
-            self.render(animate=first_render)
-            first_render = False
-            
-            try:
-                choice = input(">>> ").strip().lower()
-            except (EOFError, KeyboardInterrupt):
-                self.animate_exit()
-                return
-            
-            if choice == 'q':
-                self.animate_exit()
-                return
-            elif choice == 'p':
-                self.show_preview()
-            elif choice == '' or choice == 'enter':
-                self.apply()
-            elif choice == '?':
-                self.show_help()
-            elif choice.startswith('?') and len(choice) == 2 and choice[1].isdigit():
-                self.show_help(int(choice[1]))
-            elif choice == 'a':
-                if any(self.enabled.values()):
-                    for k in self.enabled:
-                        self.enabled[k] = False
-                else:
-                    for k in self.enabled:
-                        self.enabled[k] = True
-                self.changes_made += 1
-                self.current_profile = "custom"
-            elif choice == 's':
-                self.apply_profile("strict")
-            elif choice == 'b':
-                self.apply_profile("balanced")
-            elif choice == 'm':
-                self.apply_profile("minimal")
-            elif choice.isdigit():
-                self.toggle_with_feedback(int(choice))
+        with self._reader as reader:
+            while True:
+                if first_render:
+                    self.render(animate=True)
+                    first_render = False
+                elif self._frame_due(reader):
+                    self._paced_render()
+                
+                try:
+                    choice = reader.read_command(">>> ")
+                except (EOFError, KeyboardInterrupt):
+                    self.animate_exit()
+                    return
+                
+                if choice == 'q':
+                    self.animate_exit()
+                    return
+                self.dispatch(choice)
+    
+    def toggle_all(self):
+        """Turn every category off if any is on, otherwise turn all on."""
+        self._mask = 0 if self._mask else _ALL_ENABLED
+        self.changes_made += 1
+        self.current_profile = "custom"
+    
+    def dispatch(self, choice: str):
+        """Run the command for a key (or '?' plus a digit); '' is ENTER."""
+        command = self._KEY_COMMANDS.get(choice)
+        if command:
+            command(self)
+        elif len(choice) == 1 and "1" <= choice <= "9":
+            self.toggle_with_feedback(ord(choice) - 48)
+        elif len(choice) == 2 and choice[0] == "?" and "0" <= choice[1] <= "9":
+            self.show_help(ord(choice[1]) - 48)
+    
+    # Key -> command, looked up once per keypress instead of an if/elif chain.
+    # Lambdas rather than bare functions so instance and subclass overrides apply.
+    _KEY_COMMANDS = {
+        "p": lambda self: self.show_preview(),
+        "": lambda self: self.apply(),
+        "enter": lambda self: self.apply(),
+        "?": lambda self: self.show_help(),
+        "a": lambda self: self.toggle_all(),
+        "s": lambda self: self.apply_profile("strict"),
+        "b": lambda self: self.apply_profile("balanced"),
+        "m": lambda self: self.apply_profile("minimal"),
+    }
 
 
 def run_tui(dry_run: bool = False, backup_callback: Callable = None, 
@@ -0,0 +1,14 @@
+"""Shared pytest configuration for the ZeroBrave test suite."""
+
+import os
+import sys
+
+# Make the src modules importable once per session (or xdist worker)
+_SRC = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src")
+if _SRC not in sys.path:
+    sys.path.insert(0, _SRC)
+
+
+def pytest_collection_modifyitems(items):
+    """Run the import smoke test first, so import regressions fail fast."""
+    items.sort(key=lambda item: item.name != "test_smoke_imports")
@@ -1,23 +1,23 @@
 """Tests for ZeroBrave main module."""
 
 import json
+import os
 import platform
 from pathlib import Path
 from unittest.mock import patch
 
 import pytest
 
-# Add src to path for imports
-import sys
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
-
 from main import (
     get_policy_path,
     get_policy_paths,
     validate_policies,
+    is_brave_flatpak,
     is_brave_installed,
     find_latest_backup,
+    load_local_json,
     strip_json_comments,
+    write_json,
 )
 
 
@@ -50,15 +50,69 @@ class TestGetPolicyPath:
         assert isinstance(path, Path)
         assert "policies.json" in str(path)
     
-    @patch("platform.system")
-    def test_raises_for_unsupported_os(self, mock_system):
+    @patch("main._SYSTEM", "freebsd")
+    def test_raises_for_unsupported_os(self):
         """Should raise RuntimeError for unsupported OS."""
-        mock_system.return_value = "FreeBSD"
+        get_policy_path.cache_clear()
         
         with pytest.raises(RuntimeError, match="Unsupported operating system"):
             get_policy_path()
 
 
+class TestIsBraveFlatpak:
+    """Tests for Flatpak detection."""
+    
+    @patch("subprocess.run")
+    @patch("main.Path.exists", return_value=True)
+    def test_detects_app_directory_without_subprocess(self, mock_exists, mock_run):
+        """Should detect the Flatpak from its app directory alone."""
+        assert is_brave_flatpak() is True
+        mock_run.assert_not_called()
+    
+    @patch("subprocess.run")
+    @patch("shutil.which", return_value=None)
+    @patch("main.Path.exists", return_value=False)
+    def test_skips_subprocess_without_flatpak_binary(self, mock_exists, mock_which, mock_run):
+        """Should not spawn flatpak when it is not installed."""
+        assert is_brave_flatpak() is False
+        mock_run.assert_not_called()
+    
+    @pytest.mark.skipif(Path("/var/lib/flatpak/app/com.brave.Browser").exists(),
+                        reason="Brave Flatpak is installed system-wide")
+    @patch("subprocess.run")
+    @patch("shutil.which", return_value=None)
+    def test_ignores_leftover_app_data(self, mock_which, mock_run, tmp_path, monkeypatch):
+        """Leftover ~/.var/app data from an uninstalled Flatpak is not an install."""
+        monkeypatch.setattr("main.Path.home", lambda: tmp_path)
+        (tmp_path / ".var/app/com.brave.Browser").mkdir(parents=True)
+        assert is_brave_flatpak() is False
+        (tmp_path / ".local/share/flatpak/app/com.brave.Browser").mkdir(parents=True)
+        assert is_brave_flatpak() is True
+
+
+class TestIsBraveInstalled:
+    """Tests for Brave installation detection."""
+    
+    def test_returns_bool(self):
+        """Should return a bool on the current system."""
+        assert isinstance(is_brave_installed(), bool)
+    
+    @patch("main._SYSTEM", "freebsd")
+    def test_false_for_unsupported_os(self):
+        """Should return False when the OS has no known install paths."""
+        assert is_brave_installed() is False
+    
+    @patch("main._SYSTEM", "linux")
+    def test_ignores_dangling_symlink(self, tmp_path):
+        """A broken symlink at a candidate path is not an installed browser."""
+        link = tmp_path / "brave"
+        link.symlink_to(tmp_path / "missing")
+        with patch.dict("main._BRAVE_PATHS", {"linux": (link,)}):
+            assert is_brave_installed() is False
+            (tmp_path / "missing").touch()
+            assert is_brave_installed() is True
+
+
 class TestValidatePolicies:
     """Tests for policy validation."""
     
@@ -110,6 +164,16 @@ class TestValidatePolicies:
         assert "SafeBrowsingProtectionLevel" in warnings[0]
         assert "int" in warnings[0]
     
+    def test_warns_on_bool_for_int_policy(self):
+        """Should warn when an integer policy is given a boolean."""
+        policies = {"BrowserSignin": False}
+        
+        warnings = validate_policies(policies)
+        
+        assert len(warnings) == 1
+        assert "BrowserSignin" in warnings[0]
+        assert "got bool" in warnings[0]
+    
     def test_warns_on_wrong_string_type(self):
         """Should warn when a string policy has wrong type."""
         policies = {"WebRtcIPHandling": 123}  # int instead of string
@@ -168,6 +232,122 @@ class TestFindLatestBackup:
         # Should find the later one (alphabetically last)
         assert result is not None
         assert "20240102" in str(result)
+    
+    def test_returns_none_when_directory_missing(self, tmp_path):
+        """Should return None when the policy directory does not exist."""
+        policy_path = tmp_path / "missing" / "policies.json"
+        
+        assert find_latest_backup(policy_path) is None
+
+
+class TestLoadLocalJson:
+    """Tests for loading local policy files."""
+    
+    def test_loads_plain_json(self, tmp_path):
+        """Should parse a comment-free JSON file."""
+        policy_file = tmp_path / "policies.json"
+        policy_file.write_text('{"BraveAIChatEnabled": false}', encoding="utf-8")
+        
+        assert load_local_json(policy_file) == {"BraveAIChatEnabled": False}
+    
+    def test_loads_jsonc(self, tmp_path):
+        """Should strip comments before parsing a JSONC file."""
+        policy_file = tmp_path / "policies.json"
+        policy_file.write_text(
+            '{\n  // AI\n  "BraveAIChatEnabled": false /* Leo */\n}', encoding="utf-8"
+        )
+        
+        assert load_local_json(policy_file) == {"BraveAIChatEnabled": False}
+    
+    def test_raises_on_missing_file(self, tmp_path):
+        """Should raise RuntimeError when the file does not exist."""
+        with pytest.raises(RuntimeError, match="File not found"):
+            load_local_json(tmp_path / "missing.json")
+    
+    def test_raises_on_invalid_json(self, tmp_path):
+        """Should raise RuntimeError for malformed JSON."""
+        policy_file = tmp_path / "policies.json"
+        policy_file.write_text('{"key": }', encoding="utf-8")
+        
+        with pytest.raises(RuntimeError, match="Invalid JSON"):
+            load_local_json(policy_file)
+
+
+class TestWriteJson:
+    """Tests for writing policy files."""
+    
+    def test_writes_readable_json(self, tmp_path):
+        """Written file should round-trip through json.loads."""
+        target = tmp_path / "managed" / "policies.json"
+        data = {"BraveAIChatEnabled": False, "CookiesSessionOnlyForUrls": ["*"]}
+        
+        write_json(target, data)
+        
+        assert json.loads(target.read_text(encoding="utf-8")) == data
+    
+    def test_replaces_existing_file_without_leftovers(self, tmp_path):
+        """Should overwrite the target and leave no temporary file behind."""
+        target = tmp_path / "policies.json"
+        target.write_text('{"old": true}', encoding="utf-8")
+        
+        write_json(target, {"SyncDisabled": True})
+        
+        assert json.loads(target.read_text(encoding="utf-8")) == {"SyncDisabled": True}
+        assert [p.name for p in tmp_path.iterdir()] == ["policies.json"]
+    
+    @pytest.mark.skipif(os.name == "nt", reason="POSIX file modes")
+    def test_keeps_existing_file_mode(self, tmp_path):
+        """Replacing the file should keep its permissions, not apply the umask."""
+        target = tmp_path / "policies.json"
+        target.write_text("{}", encoding="utf-8")
+        target.chmod(0o640)
+        old_umask = os.umask(0o077)
+        try:
+            write_json(target, {"SyncDisabled": True})
+        finally:
+            os.umask(old_umask)
+        
+        assert target.stat().st_mode & 0o777 == 0o640
+    
+    @pytest.mark.skipif(os.name == "nt", reason="POSIX file modes")
+    def test_new_file_is_world_readable(self, tmp_path):
+        """A new policy file should be readable by the user running Brave."""
+        target = tmp_path / "policies.json"
+        old_umask = os.umask(0o077)
+        try:
+            write_json(target, {"SyncDisabled": True})
+        finally:
+            os.umask(old_umask)
+        
+        assert target.stat().st_mode & 0o777 == 0o644
+    
+    def test_writes_with_stdlib_json(self, tmp_path):
+        """Should fall back to stdlib json when orjson is unavailable."""
+        target = tmp_path / "policies.json"
+        data = {"WebRtcIPHandling": "disable_non_proxied_udp"}
+        
+        with patch("main.orjson", None):
+            write_json(target, data)
+        
+        assert json.loads(target.read_text(encoding="utf-8")) == data
+    
+    def test_dry_run_does_not_write(self, tmp_path):
+        """Dry-run should leave the filesystem untouched."""
+        target = tmp_path / "policies.json"
+        
+        write_json(target, {"SyncDisabled": True}, dry_run=True)
+        
+        assert not target.exists()
+    
+    def test_dry_run_preview_is_truncated(self, tmp_path, caplog):
+        """Dry-run preview should show at most 500 characters of JSON."""
+        data = {f"Policy{i}": i for i in range(1000)}
+        
+        with caplog.at_level("INFO", logger="main"):
+            write_json(tmp_path / "policies.json", data, dry_run=True)
+        
+        preview = caplog.records[-1].getMessage().split("\n", 1)[1]
+        assert preview == json.dumps(data, indent=2)[:500] + "..."
 
 
 class TestPoliciesJsonValidity:
@@ -228,4 +408,20 @@ class TestStripJsonComments:
         jsonc = '{"key": /* comment */ "value"}'
         result = strip_json_comments(jsonc)
         assert json.loads(result) == {"key": "value"}
-
+    
+    def test_preserves_escaped_quotes_in_string(self):
+        """Should not treat comment markers after an escaped quote as comments."""
+        jsonc = '{"key": "a \\" // not a comment"} /* comment */'
+        result = strip_json_comments(jsonc)
+        assert json.loads(result) == {"key": 'a " // not a comment'}
+    
+    def test_returns_input_unchanged_without_comments(self):
+        """Should pass comment-free JSON through untouched."""
+        plain = '{"key": "value"}'
+        assert strip_json_comments(plain) is plain
+    
+    def test_handles_many_unterminated_comment_starts(self):
+        """Should strip an unterminated comment without pathological backtracking."""
+        jsonc = '{"key": "value"}' + " /*" * 20000
+        result = strip_json_comments(jsonc)
+        assert json.loads(result) == {"key": "value"}
@@ -1,13 +1,75 @@
 """Tests for ZeroBrave TUI module."""
 
+import io
+import os
+import time
+from collections.abc import Mapping
+from types import SimpleNamespace
+
 import pytest
+from rich.console import Console
+
+from tui import TUI, CATEGORIES, PROFILES, _CAT_HELP_BODY, _MIN_FRAME_INTERVAL, _CharReader
+
+_CATEGORY_KEYS = tuple(cat[0] for cat in CATEGORIES)
+_CATEGORY_KEY_SET = frozenset(_CATEGORY_KEYS)
+_ALL_DISABLED = dict.fromkeys(_CATEGORY_KEYS, False)
+
+
+def _valid_cat(cat) -> bool:
+    """Whether a category has string fields, a [TAG] tag and non-empty policies."""
+    if len(cat) != 6:
+        return False
+    key, tag, name, desc, help_text, policies = cat
+    return (
+        all(type(field) is str for field in (key, tag, name, desc, help_text))
+        and tag[:1] == "[" and tag[-1:] == "]"
+        and isinstance(policies, Mapping)
+        and len(policies) > 0
+    )
+
+
+def test_smoke_imports():
+    """The TUI module should import and expose its public names."""
+    import tui
+    assert hasattr(tui, "TUI") and tui.CATEGORIES and tui.PROFILES
+
+
+@pytest.fixture(scope="module")
+def _pristine_tui():
+    """Dry-run TUI constructed once per module."""
+    return TUI(dry_run=True)
+
+
+@pytest.fixture(scope="module")
+def _pristine_live_tui():
+    """Non-dry-run TUI constructed once per module."""
+    return TUI()
+
+
+@pytest.fixture(scope="session")
+def profile_snapshots():
+    """Profile name -> (build_policies(), count_enabled()) with that profile applied."""
+    snapshot_tui = TUI(dry_run=True)
+    snapshots = {}
+    for name in PROFILES:
+        snapshot_tui.apply_profile(name)
+        snapshots[name] = (snapshot_tui.build_policies(), snapshot_tui.count_enabled())
+    return snapshots
+
 
-# Add src to path for imports
-import sys
-from pathlib import Path
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+@pytest.fixture
+def tui(_pristine_tui):
+    """The module-wide dry-run TUI, reset to its initial state."""
+    _pristine_tui.reset()
+    return _pristine_tui
 
-from tui import TUI, CATEGORIES, PROFILES
+
+@pytest.fixture
+def live_tui(_pristine_live_tui):
+    """The module-wide non-dry-run TUI, reset to its initial state."""
+    _pristine_live_tui.reset()
+    return _pristine_live_tui
 
 
 class TestTUIInitialization:
@@ -19,21 +81,38 @@ class TestTUIInitialization:
         assert tui is not None
         assert tui.dry_run is True
     
-    def test_all_categories_enabled_by_default(self):
+    def test_all_categories_enabled_by_default(self, tui):
         """All categories should be enabled initially."""
-        tui = TUI()
-        assert all(tui.enabled.values())
-        assert len(tui.enabled) == 8
+        assert sum(map(bool, tui.enabled.values())) == 8 == len(tui.enabled)
     
-    def test_default_profile_is_strict(self):
-        """Default profile should be 'strict'."""
-        tui = TUI()
-        assert tui.current_profile == "strict"
+    def test_enabled_is_read_only_snapshot(self, tui):
+        """Enabled map should reject item assignment; assign a whole mapping instead."""
+        with pytest.raises(TypeError):
+            tui.enabled["ai"] = False
+        tui.enabled = {**tui.enabled, "ai": False}
+        assert tui.enabled["ai"] is False
+        assert sum(tui.enabled.values()) == 7
+    
+    @pytest.mark.parametrize("attr,expected", [
+        ("changes_made", 0),
+        ("current_profile", "strict"),
+        ("dry_run", False),
+    ])
+    def test_default_attrs(self, live_tui, attr, expected):
+        """A default TUI should start on strict, unchanged, and not in dry-run."""
+        assert getattr(live_tui, attr) == expected
     
-    def test_changes_counter_starts_at_zero(self):
-        """Changes counter should start at 0."""
-        tui = TUI()
+    def test_reset_restores_initial_state(self, tui):
+        """reset() should undo toggles, profile changes and the change count."""
+        tui.apply_profile("minimal")
+        tui.toggle_with_feedback(1)
+        tui._frame_interval = 1.0
+        tui.reset()
+        assert tui.enabled_mask() == (1 << len(CATEGORIES)) - 1
+        assert tui.current_profile == "strict"
         assert tui.changes_made == 0
+        assert (tui._last_render, tui._render_ema) == (0.0, 0.0)
+        assert tui._frame_interval == _MIN_FRAME_INTERVAL
 
 
 class TestCategories:
@@ -43,24 +122,33 @@ class TestCategories:
         """Should have exactly 8 categories."""
         assert len(CATEGORIES) == 8
     
-    def test_categories_have_correct_structure(self):
+    @pytest.mark.parametrize("cat", CATEGORIES, ids=lambda c: c[0])
+    def test_category_structure(self, cat):
         """Each category should have key, tag, name, desc, help, policies."""
-        for cat in CATEGORIES:
-            assert len(cat) == 6
-            key, tag, name, desc, help_text, policies = cat
-            assert isinstance(key, str)
-            assert isinstance(tag, str)
-            assert tag.startswith("[") and tag.endswith("]")
-            assert isinstance(name, str)
-            assert isinstance(desc, str)
-            assert isinstance(help_text, str)
-            assert isinstance(policies, dict)
-            assert len(policies) > 0
+        assert _valid_cat(cat)
+    
+    def test_category_fields_are_named(self):
+        """Categories should expose their fields by name."""
+        cat = CATEGORIES[0]
+        assert cat.key == cat[0] == "ai"
+        assert cat.policies is cat[5]
+    
+    def test_category_policies_are_read_only(self):
+        """Category policy mappings should not be mutable."""
+        with pytest.raises(TypeError):
+            CATEGORIES[0].policies["BraveAIChatEnabled"] = True
+    
+    def test_category_help_lists_policies(self):
+        """Help text should list at most 10 policies, with an ellipsis for more."""
+        for cat, body in zip(CATEGORIES, _CAT_HELP_BODY):
+            assert body.startswith(f"[bold]{cat.tag} {cat.name}[/]")
+            listed = [line for line in body.splitlines() if line.startswith("  • ")]
+            assert len(listed) == min(len(cat.policies), 10)
+            assert body.endswith("...") == (len(cat.policies) > 10)
     
     def test_category_keys_are_unique(self):
         """Category keys should be unique."""
-        keys = [cat[0] for cat in CATEGORIES]
-        assert len(keys) == len(set(keys))
+        assert len(_CATEGORY_KEYS) == len(_CATEGORY_KEY_SET)
 
 
 class TestProfiles:
@@ -70,17 +158,28 @@ class TestProfiles:
         """Should have exactly 3 profiles."""
         assert len(PROFILES) == 3
     
-    def test_profile_names(self):
+    @pytest.mark.parametrize("name", ["strict", "balanced", "minimal"])
+    def test_profile_names(self, name):
         """Should have strict, balanced, minimal profiles."""
-        assert "strict" in PROFILES
-        assert "balanced" in PROFILES
-        assert "minimal" in PROFILES
+        assert name in PROFILES
     
     def test_strict_has_all_categories(self):
         """Strict profile should include all categories."""
         strict = PROFILES["strict"]
         assert len(strict["categories"]) == 8
     
+    def test_profiles_are_read_only(self):
+        """Profiles and their settings should not be mutable."""
+        with pytest.raises(TypeError):
+            PROFILES["custom"] = {}
+        with pytest.raises(TypeError):
+            PROFILES["strict"]["categories"] = ()
+    
+    @pytest.mark.parametrize("name", list(PROFILES))
+    def test_profile_categories_exist(self, name):
+        """Profiles should only reference known category keys."""
+        assert _CATEGORY_KEY_SET.issuperset(PROFILES[name]["categories"])
+    
     def test_minimal_has_fewer_categories(self):
         """Minimal profile should have fewer categories than strict."""
         strict_count = len(PROFILES["strict"]["categories"])
@@ -91,101 +190,424 @@ class TestProfiles:
 class TestApplyProfile:
     """Tests for profile application."""
     
-    def test_apply_strict_enables_all(self):
-        """Applying strict should enable all categories."""
-        tui = TUI()
-        tui.enabled = {cat[0]: False for cat in CATEGORIES}
-        tui.apply_profile("strict")
-        assert all(tui.enabled.values())
+    @pytest.mark.parametrize("profile,expected_enabled", [
+        ("strict", 8),
+        ("balanced", len(PROFILES["balanced"]["categories"])),
+        ("minimal", len(PROFILES["minimal"]["categories"])),
+    ])
+    def test_apply_profile(self, tui, profile, expected_enabled):
+        """Applying a profile should enable exactly its categories and select it."""
+        tui.enabled = _ALL_DISABLED.copy()
+        tui.apply_profile(profile)
+        assert sum(tui.enabled.values()) == expected_enabled
+        assert [k for k, v in tui.enabled.items() if v] == [
+            key for key in _CATEGORY_KEYS if key in PROFILES[profile]["categories"]
+        ]
+        assert tui.current_profile == profile
     
-    def test_apply_minimal_enables_subset(self):
-        """Applying minimal should enable only a subset."""
-        tui = TUI()
+    def test_apply_profile_tracks_changes(self, tui):
+        """Changes counter should increase when profile changes."""
         tui.apply_profile("minimal")
-        enabled_count = sum(1 for v in tui.enabled.values() if v)
-        assert enabled_count == len(PROFILES["minimal"]["categories"])
+        assert tui.changes_made > 0
     
-    def test_apply_profile_updates_current_profile(self):
-        """Current profile should be updated."""
-        tui = TUI()
+    def test_apply_profile_counts_flipped_categories(self, tui):
+        """Each category that changes state should count as one change."""
+        tui.apply_profile("minimal")
+        tui.changes_made = 0
         tui.apply_profile("balanced")
-        assert tui.current_profile == "balanced"
+        minimal = set(PROFILES["minimal"]["categories"])
+        balanced = set(PROFILES["balanced"]["categories"])
+        assert tui.changes_made == len(minimal ^ balanced)
     
-    def test_apply_profile_tracks_changes(self):
-        """Changes counter should increase when profile changes."""
-        tui = TUI()
-        tui.apply_profile("minimal")
-        assert tui.changes_made > 0
+    def test_unknown_profile_is_ignored(self, tui):
+        """Unknown profile keys should leave the state untouched."""
+        tui.apply_profile("paranoid")
+        assert tui.current_profile == "strict"
+        assert tui.changes_made == 0
 
 
 class TestBuildPolicies:
     """Tests for policy building."""
     
-    def test_builds_dict_from_enabled(self):
+    def test_builds_dict_from_enabled(self, tui):
         """Should build a dict of enabled policies."""
-        tui = TUI()
         policies = tui.build_policies()
         assert isinstance(policies, dict)
         assert len(policies) > 0
     
-    def test_empty_when_all_disabled(self):
+    def test_empty_when_all_disabled(self, tui):
         """Should return empty dict when all disabled."""
-        tui = TUI()
-        tui.enabled = {cat[0]: False for cat in CATEGORIES}
+        tui.enabled = _ALL_DISABLED.copy()
         policies = tui.build_policies()
         assert policies == {}
     
-    def test_strict_has_most_policies(self):
+    def test_view_matches_built_dict(self, tui):
+        """Merged view should have the same items and order as build_policies."""
+        tui.apply_profile("balanced")
+        assert list(tui.build_policies_view().items()) == list(tui.build_policies().items())
+    
+    def test_enabled_mask_tracks_categories(self, tui):
+        """Mask should have one bit per enabled category, in category order."""
+        assert tui.enabled_mask() == (1 << len(CATEGORIES)) - 1
+        tui.toggle_with_feedback(1)
+        assert tui.enabled_mask() == (1 << len(CATEGORIES)) - 2
+    
+    def test_strict_has_most_policies(self, profile_snapshots):
         """Strict profile should have the most policies."""
-        tui = TUI()
-        tui.apply_profile("strict")
-        strict_count = len(tui.build_policies())
-        
-        tui.apply_profile("minimal")
-        minimal_count = len(tui.build_policies())
-        
-        assert strict_count > minimal_count
+        assert all(
+            len(profile_snapshots["strict"][0]) > len(policies)
+            for name, (policies, _) in profile_snapshots.items() if name != "strict"
+        )
 
 
 class TestCountEnabled:
     """Tests for counting enabled policies."""
     
-    def test_counts_all_when_strict(self):
-        """Should count all categories and policies for strict."""
-        tui = TUI()
-        tui.apply_profile("strict")
+    @pytest.mark.parametrize("setup,expected_cats,policy_pred", [
+        ("strict", 8, lambda p: p > 50),  # We have 61 policies
+        ("all_disabled", 0, lambda p: p == 0),
+    ], ids=["strict", "all_disabled"])
+    def test_counts(self, tui, setup, expected_cats, policy_pred):
+        """Should count enabled categories and their policies."""
+        if setup == "strict":
+            tui.apply_profile("strict")
+        else:
+            tui.enabled = _ALL_DISABLED.copy()
         cats, policies = tui.count_enabled()
-        assert cats == 8
-        assert policies > 50  # We have 61 policies
+        assert cats == expected_cats
+        assert policy_pred(policies)
     
-    def test_counts_zero_when_all_disabled(self):
-        """Should return 0 when all disabled."""
-        tui = TUI()
-        tui.enabled = {cat[0]: False for cat in CATEGORIES}
-        cats, policies = tui.count_enabled()
-        assert cats == 0
-        assert policies == 0
+    @pytest.mark.parametrize("profile", list(PROFILES))
+    def test_counts_match_built_policies(self, profile, profile_snapshots):
+        """Counts should agree with the categories and policies actually built."""
+        policies, (cats, count) = profile_snapshots[profile]
+        assert cats == len(PROFILES[profile]["categories"])
+        assert count == len(policies)
 
 
 class TestToggle:
     """Tests for toggle functionality."""
     
-    def test_toggle_changes_state(self):
-        """Toggle should flip the enabled state."""
-        tui = TUI()
+    def test_toggle_behavior(self, tui):
+        """Toggle should flip the state, count a change, and leave the profile."""
         initial = tui.enabled["ai"]
+        initial_changes = tui.changes_made
         tui.toggle_with_feedback(1)  # AI is category 1
         assert tui.enabled["ai"] != initial
+        assert tui.changes_made == initial_changes + 1
+        assert tui.current_profile == "custom"
     
-    def test_toggle_increments_changes(self):
-        """Toggle should increment changes counter."""
-        tui = TUI()
-        initial_changes = tui.changes_made
+    def test_no_ansi_feedback_on_legacy_windows(self, monkeypatch):
+        """Legacy Windows consoles should get uncoloured feedback lines."""
+        monkeypatch.setattr(
+            "tui.Console",
+            lambda **kw: Console(legacy_windows=True, color_system="windows", **kw),
+        )
+        legacy = TUI()
+        assert "\x1b" not in "".join(legacy._feedback_on + legacy._feedback_off)
+    
+    def test_render_after_toggle_shows_custom_profile(self, tui, monkeypatch):
+        """Rendering should work once the profile becomes 'custom'."""
+        monkeypatch.setattr(tui, "console", Console(file=io.StringIO(), width=100))
         tui.toggle_with_feedback(1)
-        assert tui.changes_made == initial_changes + 1
+        tui.render()
+        assert "Profile: Custom" in tui.console.file.getvalue()
     
-    def test_toggle_sets_custom_profile(self):
-        """Toggle should set profile to 'custom'."""
-        tui = TUI()
+    def test_render_writes_frame_once(self, tui, monkeypatch):
+        """A static render should reach the output in a single non-empty write."""
+        class CountingIO(io.StringIO):
+            writes = 0
+            
+            def write(self, s):
+                self.writes += bool(s)
+                return super().write(s)
+        
+        console = Console(file=CountingIO(), width=100, force_terminal=True)
+        monkeypatch.setattr(tui, "console", console)
+        tui.render()
+        assert tui.console.file.writes == 1
+        assert "Commands" in tui.console.file.getvalue()
+    
+    def test_render_prints_directly_on_legacy_windows(self, tui, monkeypatch):
+        """Legacy Windows consoles should not get a captured ANSI frame."""
+        console = Console(file=io.StringIO(), width=100)
+        monkeypatch.setattr(console, "legacy_windows", True)
+        monkeypatch.setattr(tui, "console", console)
+        monkeypatch.setattr(console, "capture", lambda: pytest.fail("frame was captured"))
+        tui.render()
+        assert "Commands" in console.file.getvalue()
+    
+    def test_toggle_updates_table_row(self, tui):
+        """Table status cell should follow the toggled category."""
+        tui._sync_table()
         tui.toggle_with_feedback(1)
-        assert tui.current_profile == "custom"
+        tui._sync_table()
+        assert tui._status_cells[0].plain == "-- OFF"
+        assert tui._status_cells[1].plain == "++ ON"
+
+
+class TestApply:
+    """Tests for applying policies."""
+    
+    def test_progress_follows_callback(self, live_tui, monkeypatch):
+        """Progress should be driven by the callback, not a fixed animation."""
+        from rich.progress import Progress
+        
+        monkeypatch.setattr("builtins.input", lambda *_: "")
+        calls = []
+        states = []
+        original_update = Progress.update
+        
+        def recording_update(self, task_id, **kwargs):
+            original_update(self, task_id, **kwargs)
+            task = self.tasks[0]
+            states.append((task.completed, task.total, task.description))
+        
+        monkeypatch.setattr(Progress, "update", recording_update)
+        
+        def apply_callback(policies, dry_run, progress_cb=None):
+            calls.append((len(policies), dry_run))
+            progress_cb(0, len(policies), "Writing configuration...")
+            progress_cb(len(policies), len(policies), "Done")
+        
+        monkeypatch.setattr(live_tui, "apply_callback", apply_callback)
+        live_tui.changes_made = 3
+        live_tui.apply()
+        
+        total = len(live_tui.build_policies())
+        assert calls == [(total, False)]
+        assert states == [(0, total, "Writing configuration..."), (total, total, "Done")]
+        assert live_tui.changes_made == 0
+    
+    def test_callback_receives_plain_dict(self, tui, monkeypatch):
+        """The callback should get a standalone dict of the enabled policies."""
+        monkeypatch.setattr("builtins.input", lambda *_: "")
+        received = []
+        
+        monkeypatch.setattr(tui, "apply_callback", lambda p, d: received.append(p))
+        tui.apply_profile("balanced")
+        tui.apply()
+        
+        assert type(received[0]) is dict
+        assert list(received[0].items()) == list(tui.build_policies().items())
+    
+    def test_dry_run_calls_callback_without_progress(self, tui, monkeypatch):
+        """Dry-run should call the callback without a progress reporter."""
+        monkeypatch.setattr("builtins.input", lambda *_: "")
+        calls = []
+        
+        monkeypatch.setattr(tui, "apply_callback", lambda p, d: calls.append(d))
+        tui.apply()
+        
+        assert calls == [True]
+
+
+class TestDispatch:
+    """Tests for key command dispatch."""
+    
+    @pytest.mark.parametrize("key,profile", [("s", "strict"), ("b", "balanced"), ("m", "minimal")])
+    def test_profile_keys(self, tui, key, profile):
+        """Profile keys should apply their profile."""
+        tui.dispatch("m" if key != "m" else "b")
+        tui.dispatch(key)
+        assert tui.current_profile == profile
+    
+    def test_digit_toggles_category(self, tui):
+        """Digit keys should toggle the matching category."""
+        tui.dispatch("3")
+        assert tui.enabled[CATEGORIES[2].key] is False
+    
+    def test_toggle_all(self, tui):
+        """'a' should clear all categories, then enable them again."""
+        tui.dispatch("a")
+        assert tui.enabled_mask() == 0
+        tui.dispatch("a")
+        assert all(tui.enabled.values())
+    
+    def test_help_waits_through_the_reader(self, tui, monkeypatch):
+        """Help should wait for ENTER via the key reader, not builtin input()."""
+        waits = []
+        monkeypatch.setattr(tui, "console", Console(file=io.StringIO(), width=100))
+        monkeypatch.setattr(tui._reader, "wait_enter", waits.append)
+        monkeypatch.setattr("builtins.input", lambda *_: pytest.fail("input() called"))
+        tui.dispatch("?2")
+        assert waits == ["Press ENTER to go back..."]
+    
+    def test_help_with_digit(self, tui, monkeypatch):
+        """'?N' should open help for category N."""
+        shown = []
+        monkeypatch.setattr(tui, "show_help", lambda n=None: shown.append(n))
+        tui.dispatch("?5")
+        tui.dispatch("?")
+        assert shown == [5, None]
+    
+    def test_unknown_key_is_ignored(self, tui):
+        """Unknown keys should not change any state."""
+        tui.dispatch("z")
+        tui.dispatch("9")
+        assert tui.enabled_mask() == (1 << len(CATEGORIES)) - 1
+        assert tui.changes_made == 0
+
+
+class _FakeTTY:
+    """Pipe-backed stdin that claims to be a terminal."""
+    
+    def __init__(self, data: bytes, close: bool = True):
+        self.fd, self.write_fd = os.pipe()
+        os.write(self.write_fd, data)
+        if close:
+            os.close(self.write_fd)
+            self.write_fd = None
+    
+    def isatty(self):
+        return True
+    
+    def fileno(self):
+        return self.fd
+    
+    def close(self):
+        for fd in (self.fd, self.write_fd):
+            if fd is not None:
+                os.close(fd)
+
+
+@pytest.fixture
+def fake_tty():
+    """Factory for _FakeTTY streams, closing their pipes after the test."""
+    streams = []
+    
+    def make(data: bytes, close: bool = True) -> _FakeTTY:
+        streams.append(_FakeTTY(data, close))
+        return streams[-1]
+    
+    yield make
+    for stream in streams:
+        stream.close()
+
+
+class TestCharReader:
+    """Tests for single-key command input."""
+    
+    @pytest.mark.skipif(os.name == "nt", reason="uses POSIX pipes with select()")
+    @pytest.mark.parametrize("data,commands", [
+        (b"1", ["1"]),
+        (b"\n", [""]),
+        (b"?3", ["?3"]),
+        (b"?q", ["?", "q"]),
+        (b"S", ["s"]),
+        (b"?\n1", ["?", "1"]),
+        (b"\x1b[A1", ["\x00", "1"]),
+        (b"\x1b[1;5B\x1bOPm", ["\x00", "\x00", "m"]),
+        ("ñ1".encode(), ["ñ", "1"]),
+        ("à1".encode(), ["à", "1"]),
+    ], ids=repr)
+    def test_reads_single_keys(self, data, commands, fake_tty, capsys):
+        """Keys should be returned without waiting for ENTER."""
+        reader = _CharReader(fake_tty(data))
+        assert [reader.read_command(">>> ") for _ in commands] == commands
+    
+    @pytest.mark.skipif(os.name == "nt", reason="uses POSIX pipes with select()")
+    def test_eof_raises(self, fake_tty, capsys):
+        """A closed stdin should end the loop like input() does."""
+        reader = _CharReader(fake_tty(b""))
+        with pytest.raises(EOFError):
+            reader.read_command(">>> ")
+    
+    @pytest.mark.skipif(os.name == "nt", reason="uses POSIX pipes with select()")
+    def test_pending_reports_queued_keys(self, fake_tty, capsys):
+        """pending() should be true only while keys are waiting."""
+        reader = _CharReader(fake_tty(b"12", close=False))
+        assert reader.pending()
+        reader.read_command(">>> ")
+        assert reader.pending()
+        reader.read_command(">>> ")
+        assert not reader.pending()
+    
+    @pytest.mark.skipif(os.name == "nt", reason="uses POSIX pipes with select()")
+    def test_enter_after_help_is_dropped(self, fake_tty, capsys):
+        """'?' then ENTER should open help without queueing an apply."""
+        reader = _CharReader(fake_tty(b"?\n", close=False))
+        assert reader.read_command(">>> ") == "?"
+        assert not reader.pending()
+    
+    @pytest.mark.skipif(os.name == "nt", reason="uses POSIX pipes with select()")
+    def test_wait_enter_leaves_later_keys_for_the_reader(self, fake_tty, capsys):
+        """Keys after ENTER should stay readable as the next command."""
+        reader = _CharReader(fake_tty(b"xy\nq"))
+        reader.wait_enter("Press ENTER...")
+        assert reader.read_command(">>> ") == "q"
+    
+    def test_wait_enter_falls_back_to_input(self, monkeypatch):
+        """Non-interactive stdin should wait with input(), tolerating EOF."""
+        def closed(*_):
+            raise EOFError
+        
+        monkeypatch.setattr("builtins.input", closed)
+        _CharReader(io.StringIO()).wait_enter("Press ENTER...")
+    
+    def test_windows_escape_does_not_touch_stdin_fd(self, monkeypatch, capsys):
+        """On the msvcrt path ESC is ignored without select()/os.read() on stdin."""
+        keys = iter(["\x1b", "1"])
+        monkeypatch.setattr("tui.termios", None)
+        monkeypatch.setattr("tui.msvcrt", SimpleNamespace(
+            getwch=lambda: next(keys), kbhit=lambda: False,
+        ))
+        monkeypatch.setattr("tui.select.select", lambda *a: pytest.fail("select() called"))
+        monkeypatch.setattr("tui.os.read", lambda *a: pytest.fail("os.read() called"))
+        reader = _CharReader(SimpleNamespace(isatty=lambda: True))
+        assert [reader.read_command(">>> ") for _ in range(2)] == ["\x00", "1"]
+    
+    def test_windows_scan_code_prefix_is_skipped(self, monkeypatch, capsys):
+        """On the msvcrt path '\xe0' starts a two-key arrow/function code."""
+        keys = iter(["\xe0", "H", "m"])
+        monkeypatch.setattr("tui.termios", None)
+        monkeypatch.setattr("tui.msvcrt", SimpleNamespace(
+            getwch=lambda: next(keys), kbhit=lambda: False,
+        ))
+        reader = _CharReader(SimpleNamespace(isatty=lambda: True))
+        assert [reader.read_command(">>> ") for _ in range(2)] == ["\x00", "m"]
+    
+    def test_falls_back_to_input_when_not_a_tty(self, monkeypatch):
+        """Non-interactive stdin should keep line-based input."""
+        monkeypatch.setattr("builtins.input", lambda *_: " P ")
+        with _CharReader(io.StringIO()) as reader:
+            assert reader.raw is False
+            assert reader.read_command(">>> ") == "p"
+            assert reader.pending() is False
+
+
+class _StubReader:
+    def __init__(self, queued: bool):
+        self.queued = queued
+    
+    def pending(self):
+        return self.queued
+
+
+class TestFramePacing:
+    """Tests for coalescing redraws between queued keys."""
+    
+    def test_renders_when_no_keys_are_queued(self, tui):
+        """With nothing queued the frame should always be drawn."""
+        tui._last_render = time.monotonic()
+        assert tui._frame_due(_StubReader(False))
+    
+    def test_skips_frame_while_keys_are_queued(self, tui):
+        """Queued keys right after a render should be coalesced."""
+        tui._last_render = time.monotonic()
+        assert not tui._frame_due(_StubReader(True))
+        tui._last_render -= 1
+        assert tui._frame_due(_StubReader(True))
+    
+    def test_slow_renders_widen_the_interval(self, tui, monkeypatch):
+        """The frame interval should follow measured render time."""
+        clock = [0.0]
+        monkeypatch.setattr("tui.time.monotonic", lambda: clock[0])
+        
+        def slow_render():
+            clock[0] += 0.05
+        
+        monkeypatch.setattr(tui, "render", slow_render)
+        for _ in range(10):
+            tui._paced_render()
+        assert tui._frame_interval > 0.05